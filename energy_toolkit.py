@@ -15,170 +15,553 @@ What it does:
 """
 
 import csv
+import io
+import os
 import re
+import math
+import heapq
+from array import array
+from functools import cached_property
+from itertools import accumulate, chain, compress, count, islice, repeat
+from operator import itemgetter, mul, not_
 from datetime import datetime
-from typing import List, Dict, Tuple
-from collections import defaultdict
+from typing import Iterator, List, Dict, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import statistics
 import json
 
 
-class ProductionDataProcessor:
-    """Process and analyze daily production data from CSV files"""
+# Report layout pieces, built once at import
+_BAR = "=" * 60
+_SUBBAR = "-" * 40
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
 
-    def __init__(self, filepath: str):
+class ProductionDataProcessor:
+    """
+    Process and analyze daily production data from CSV files
+
+    The loaded data is treated as read-only: derived values are cached on
+    first use, and load_data() is the way to refresh them.
+
+    Production values are stored as float64 ('d') by default. Pass
+    typecode='f' to store them as float32, which halves the memory taken
+    by the production column at about 7 significant digits; sums and
+    means are still accumulated in double precision. The dates column
+    is unaffected and usually much larger.
+    """
+
+    TYPECODES = ('d', 'f')
+    STREAM_CHUNK_ROWS = 100_000
+
+    def __init__(self, filepath: str, typecode: str = 'd'):
+        if typecode not in self.TYPECODES:
+            raise ValueError(
+                f"typecode must be one of {self.TYPECODES}, got {typecode!r}"
+            )
         self.filepath = filepath
-        self.data = []
+        self.typecode = typecode
+        self.dates = []
+        self.productions = array(typecode)
+        self._invalid = {}
         self.load_data()
 
     def load_data(self) -> None:
-        """Load production data from CSV file"""
+        """
+        Load the date and production columns from the CSV file.
+
+        Data is stored by column: self.dates holds the date strings and
+        self.productions a flat float array. Production values are converted
+        to float once here; cells that can't be parsed become NaN and their
+        original text is kept for validate_data().
+        """
+        try:
+            with open(self.filepath, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                rows = list(filter(None, reader))
+        except FileNotFoundError:
+            raise Exception(f"File not found: {self.filepath}")
+
+        date_i, prod_i = self._column_indices(header)
+        self.dates = self._column(rows, date_i, 'Unknown')
+        raw = self._column(rows, prod_i, '0')
+
+        self.productions = self._to_floats(raw, self.typecode)
+        self._invalid = {i: raw[i] for i, prod in enumerate(self.productions)
+                         if math.isnan(prod)}
+        self.__dict__.pop('_prod_array', None)
+        self.__dict__.pop('data', None)
+
+    @cached_property
+    def data(self) -> List[Dict]:
+        """
+        The rows as dicts keyed by the CSV header, as csv.DictReader gives
+        them. They are read from the file on first access, so until then
+        the columns are all that is kept in memory.
+        """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-                self.data = list(reader)
+            with open(self.filepath, 'r', encoding='utf-8', newline='') as f:
+                return list(csv.DictReader(f))
         except FileNotFoundError:
             raise Exception(f"File not found: {self.filepath}")
 
+    @staticmethod
+    def _column_indices(header: List[str]) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Positions of the date and production columns, or None if missing.
+
+        A repeated name resolves to its last column, as it does for
+        csv.DictReader.
+        """
+        last = {name: i for i, name in enumerate(header)}
+        return last.get('date'), last.get('production')
+
+    @staticmethod
+    def _column(rows: List[List[str]], index: Optional[int], default: str) -> List[str]:
+        """
+        One field from every row.
+
+        A missing column gives `default` for every row, like row.get() on
+        the old dict rows: 'Unknown' dates, and production 0. Short rows
+        give an empty string, so a missing production value is reported as
+        invalid.
+        """
+        if index is None:
+            return [default] * len(rows)
+        try:
+            # Specialized to this file's header: one C-level itemgetter
+            # pulls the field from each row, with no per-row dict
+            return list(map(itemgetter(index), rows))
+        except IndexError:
+            return [row[index] if index < len(row) else '' for row in rows]
+
+    @staticmethod
+    def _to_floats(values: List[str], typecode: str = 'd') -> array:
+        """Convert a column of strings to floats, using NaN for bad values"""
+        try:
+            # Fast path: the whole column converts in one C-level pass
+            return array(typecode, map(float, values))
+        except ValueError:
+            pass
+
+        result = array(typecode)
+        for value in values:
+            try:
+                result.append(float(value))
+            except ValueError:
+                result.append(math.nan)
+        return result
+
+    @cached_property
+    def _prod_array(self) -> Tuple[array, bytes]:
+        """
+        Production values with a validity mask, computed once per load.
+
+        The mask holds one byte per row: 1 if the value parsed, 0 if not.
+        """
+        values = self.productions
+        return values, bytes(map(not_, map(math.isnan, values)))
+
     def validate_data(self) -> List[Dict]:
         """
         Check production data for common errors.
+
+        A single scan picks out the rows that fail `value >= 0` (negative
+        values and NaN, since NaN never compares true), so error records are
+        only built for the flagged rows.
         """
-        errors = []
-        for i, row in enumerate(self.data):
-            if 'production' in row:
-                try:
-                    prod = float(row['production'])
-                    if prod < 0:
-                        errors.append({
-                            'row': i + 1,
-                            'error': 'Negative production value',
-                            'value': prod
-                        })
-                except ValueError:
-                    errors.append({
-                        'row': i + 1,
-                        'error': 'Invalid production value',
-                        'value': row['production']
-                    })
-        return errors
+        values, valid = self._prod_array
+        flagged = [i for i, value in enumerate(values) if not value >= 0]
+
+        return [
+            {
+                'row': i + 1,
+                'error': 'Negative production value',
+                'value': values[i]
+            } if valid[i] else {
+                'row': i + 1,
+                'error': 'Invalid production value',
+                'value': self._invalid[i]
+            }
+            for i in flagged
+        ]
 
     def calculate_daily_average(self) -> float:
         """Calculate average daily production"""
-        productions = []
-        for row in self.data:
-            try:
-                productions.append(float(row.get('production', 0)))
-            except ValueError:
-                continue
+        values, valid = self._prod_array
 
-        if len(productions) == 0:
+        if not any(valid):
             return 0.0
 
-        return statistics.mean(productions)
+        try:
+            return statistics.fmean(compress(values, valid))
+        except (OverflowError, ValueError):
+            # fsum gives up on inf + -inf and on sums past the float range;
+            # statistics.mean handles both, as it always did here
+            return statistics.mean(compress(values, valid))
 
     def get_top_days(self, n: int = 5) -> List[Dict]:
-        """Get top N production days"""
-        valid_data = []
+        """
+        Get top N production days
 
-        for row in self.data:
-            try:
-                prod = float(row.get('production', 0))
-                valid_data.append({
-                    'date': row.get('date', 'Unknown'),
-                    'production': prod
-                })
-            except ValueError:
-                continue
+        Uses a size-n heap instead of sorting every row, so the cost is
+        O(N log n) rather than O(N log N). Ties keep file order.
+        """
+        values, valid = self._prod_array
+        rows = heapq.nlargest(n, compress(range(len(values)), valid),
+                              key=values.__getitem__)
 
-        sorted_data = sorted(valid_data, key=lambda x: x['production'], reverse=True)
-        return sorted_data[:n]
+        return [
+            {'date': self.dates[i], 'production': values[i]}
+            for i in rows
+        ]
 
+    @classmethod
+    def stream_top_days(cls, filepath: str, n: int = 5) -> List[Dict]:
+        """
+        Get top N production days straight from a CSV file, without loading it
 
-class LogFileAnalyzer:
-    """Analyze system log files for errors and patterns"""
+        Rows are read STREAM_CHUNK_ROWS at a time; each chunk is ranked
+        with a size-n heap and merged into the running top n, so memory
+        stays bounded however large the file is. Gives the same result as
+        get_top_days() on a loaded processor.
+        """
+        try:
+            with open(filepath, 'r', encoding='utf-8', newline='') as f:
+                reader = csv.reader(f)
+                date_i, prod_i = cls._column_indices(next(reader, []))
+                rows = filter(None, reader)
+
+                top = []
+                while True:
+                    chunk = list(islice(rows, cls.STREAM_CHUNK_ROWS))
+                    if not chunk:
+                        break
+                    dates = cls._column(chunk, date_i, 'Unknown')
+                    values = cls._to_floats(cls._column(chunk, prod_i, '0'))
+                    valid = compress(count(), map(not_, map(math.isnan, values)))
+                    chunk_top = [
+                        (dates[i], values[i])
+                        for i in heapq.nlargest(n, valid, key=values.__getitem__)
+                    ]
+                    # Earlier rows go first so ties keep file order
+                    top = heapq.nlargest(n, chain(top, chunk_top), key=itemgetter(1))
+        except FileNotFoundError:
+            raise Exception(f"File not found: {filepath}")
+
+        return [{'date': date, 'production': prod} for date, prod in top]
 
-    def __init__(self, filepath: str):
+
+class LogFileAnalyzer:
+    """
+    Analyze system log files for errors and patterns
+
+    The file is read once by load_logs(), in text mode, so line endings
+    (including CRLF) are handled as Python normally does. The loaded lines
+    are treated as read-only: analysis results are cached, and load_logs()
+    is the way to refresh them.
+
+    With workers > 1, analyze() splits the file into that many byte
+    ranges at line boundaries and scans them in separate processes. Each
+    worker reads only its own range and sends back just the counts and
+    error lines. If the file's size or modification time no longer match
+    what load_logs() read, the loaded lines are scanned here instead.
+    Worker start-up costs tens of milliseconds, so this needs large files
+    and spare cores to pay off. As with any process pool, call it from
+    under an `if __name__ == "__main__":` guard on platforms that spawn
+    workers.
+    """
+
+    READ_BUFFER_SIZE = 1 << 20
+
+    def __init__(self, filepath: str, workers: int = 1):
         self.filepath = filepath
+        self.workers = workers
         self.logs = []
+        self._stamp = None
         self.load_logs()
 
     def load_logs(self) -> None:
-        """Load log file content"""
+        """
+        Load log file content
+
+        Everything is read here, so later calls never touch the file and
+        can't be affected by it being rotated or truncated.
+        """
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
+            with open(self.filepath, 'r', encoding='utf-8', errors='replace',
+                      buffering=self.READ_BUFFER_SIZE) as f:
+                before = _file_stamp(f)
                 self.logs = f.readlines()
+                # Only a file that held still while it was read can be
+                # handed to workers by byte range
+                self._stamp = before if _file_stamp(f) == before else None
         except FileNotFoundError:
             raise Exception(f"Log file not found: {self.filepath}")
+        self.__dict__.pop('_analysis', None)
 
-    def count_by_level(self) -> Dict[str, int]:
-        """Count log entries by severity"""
-        counts = defaultdict(int)
+    def iter_logs(self) -> Iterator[str]:
+        """
+        Stream log lines straight from the file.
+
+        For files too large to load at once; nothing is kept in memory
+        between lines. Yields the same lines load_logs() would.
+        """
+        try:
+            with open(self.filepath, 'r', encoding='utf-8', errors='replace',
+                      buffering=self.READ_BUFFER_SIZE) as f:
+                yield from f
+        except FileNotFoundError:
+            raise Exception(f"Log file not found: {self.filepath}")
+
+    @staticmethod
+    def _scan_levels(lines: List[str]) -> Tuple[Counter, List[str]]:
+        """
+        Level counts and error lines for a run of log lines
+
+        A line mentioning several levels counts under the highest one:
+        ERROR, then WARNING, then INFO. Error lines are returned as loaded;
+        callers strip them only when they hand them out.
+        """
+        counts = Counter()
+        errors = []
 
-        for log in self.logs:
+        for log in lines:
             log_upper = log.upper()
             if 'ERROR' in log_upper:
-                counts['ERROR'] += 1
+                level = 'ERROR'
+                errors.append(log)
             elif 'WARNING' in log_upper:
-                counts['WARNING'] += 1
+                level = 'WARNING'
             elif 'INFO' in log_upper:
-                counts['INFO'] += 1
+                level = 'INFO'
+            else:
+                continue
+            counts[level] += 1
+
+        return counts, errors
+
+    def _chunk_bounds(self, chunks: int) -> List[Tuple[int, int]]:
+        """Split the file into at most `chunks` byte ranges on line boundaries"""
+        size = self._stamp[0]
+        bounds = [0]
+        with open(self.filepath, 'rb') as f:
+            for k in range(1, chunks):
+                f.seek(max(size * k // chunks, bounds[-1]))
+                f.readline()
+                cut = f.tell()
+                if cut >= size:
+                    break
+                if cut > bounds[-1]:
+                    bounds.append(cut)
+        bounds.append(size)
+        return list(zip(bounds, bounds[1:]))
+
+    @cached_property
+    def _analysis(self) -> Tuple[Dict[str, int], List[str]]:
+        """Level counts and error lines, gathered in one pass over the logs"""
+        parts = None
+        if self.workers > 1 and len(self.logs) > 1 and self._stamp is not None:
+            parts = self._scan_in_workers()
+
+        if parts is None:
+            counts, errors = self._scan_levels(self.logs)
+            return dict(counts), errors
+
+        counts = Counter()
+        errors = []
+        # Results come back in file order, so the merged error list and
+        # the first-seen order of levels match a serial scan
+        for part_counts, part_errors in parts:
+            counts.update(part_counts)
+            errors.extend(part_errors)
+        return dict(counts), errors
+
+    def _scan_in_workers(self) -> Optional[List[Tuple[Counter, List[str]]]]:
+        """Per-range scan results, or None if the file changed since loading"""
+        try:
+            starts, ends = zip(*self._chunk_bounds(self.workers))
+            with ProcessPoolExecutor(max_workers=len(starts)) as pool:
+                parts = list(pool.map(_scan_log_range, repeat(self.filepath),
+                                      starts, ends, repeat(self._stamp)))
+        except OSError:
+            return None
+        return None if None in parts else parts
+
+    def analyze(self) -> Tuple[Dict[str, int], List[str]]:
+        """Count entries by severity and collect error messages in one pass"""
+        counts, errors = self._analysis
+        return dict(counts), [log.strip() for log in errors]
 
-        return dict(counts)
+    def count_by_level(self) -> Dict[str, int]:
+        """Count log entries by severity"""
+        return dict(self._analysis[0])
 
     def extract_errors(self) -> List[str]:
         """Get all error messages from logs"""
-        return [log.strip() for log in self.logs if 'ERROR' in log.upper()]
+        return [log.strip() for log in self._analysis[1]]
 
     def find_pattern(self, pattern: str) -> List[Tuple[int, str]]:
-        """Search for pattern in logs"""
-        matches = []
-        for i, log in enumerate(self.logs):
-            if re.search(pattern, log, re.IGNORECASE):
-                matches.append((i + 1, log.strip()))
-        return matches
+        """
+        Search for pattern in logs
+
+        The pattern is compiled once and then tried against each line on
+        its own, newline included, so anchors such as ^, $ and \\A apply
+        per line. Lines and pattern are both str, so case is ignored for
+        non-ASCII letters too.
+        """
+        search = re.compile(pattern, re.IGNORECASE).search
+        return [(i, log.strip()) for i, log in enumerate(self.logs, 1) if search(log)]
+
+
+def _file_stamp(f) -> Tuple[int, int]:
+    """Size and modification time of an open file"""
+    st = os.fstat(f.fileno())
+    return st.st_size, st.st_mtime_ns
+
+
+def _scan_log_range(filepath: str, start: int, end: int,
+                    stamp: Tuple[int, int]) -> Optional[Tuple[Counter, List[str]]]:
+    """
+    Worker for parallel log analysis: scan bytes [start, end) of the file
+
+    The range is decoded just as load_logs() reads the whole file. Returns
+    None if the file no longer has the size and modification time it had
+    when it was loaded.
+    """
+    with open(filepath, 'rb') as f:
+        if _file_stamp(f) != stamp:
+            return None
+        f.seek(start)
+        data = f.read(end - start)
+        if _file_stamp(f) != stamp:
+            return None
+
+    text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace')
+    return LogFileAnalyzer._scan_levels(text.readlines())
 
 
 class TimeSeriesAnalyzer:
-    """Analyze time-series data for trends and anomalies"""
+    """
+    Analyze time-series data for trends and anomalies
+
+    Any sequence of numbers works, including a compact array('f') such as
+    ProductionDataProcessor.productions; results are computed in double
+    precision either way.
+    """
 
     def __init__(self, data: List[float]):
         self.data = data
 
     def moving_average(self, window: int = 7) -> List[float]:
+        """
+        Simple moving average over each full window.
+
+        Each window sum is the difference of two prefix sums, so the cost is
+        O(N) whatever the window size. The prefix sums restart every block
+        to keep their rounding local. A window whose sum can't be trusted
+        against that rounding (such as small values right after a huge one)
+        is summed again exactly. So is every window of a block that holds
+        inf or NaN, and those come out as a plain sum would give them.
+        """
+        data = self.data
+        if len(data) < window:
+            return data
+
+        # Each block spans at least four windows, and enough values that
+        # windows of same-sign data rarely need summing again
+        span = max(math.isqrt(window << 14), 4 * window)
+        block = span - window + 1
+        result = []
+        for start in range(0, len(data) - window + 1, block):
+            chunk = data[start:start + span]
+            sums = list(accumulate(chunk, initial=0))
+            if not math.isfinite(sums[-1]):
+                result += [self._exact_sum(chunk[i:i + window]) / window
+                           for i in range(len(chunk) - window + 1)]
+                continue
+
+            # The prefix sums are off by at most len(chunk) * max|sum| * 2**-53,
+            # so windows above `tiny` are good to about 2**-27 relative
+            tiny = len(chunk) * max(map(abs, sums)) * 2 ** -26
+            result += [
+                (b - a) / window if abs(b - a) >= tiny
+                else self._exact_sum(chunk[i:i + window]) / window
+                for i, (a, b) in enumerate(zip(sums, sums[window:]))
+            ]
+        return result
+
+    @staticmethod
+    def _exact_sum(values: List[float]) -> float:
+        """math.fsum, or a plain sum where fsum gives up (inf - inf, overflow)"""
+        try:
+            return math.fsum(values)
+        except (OverflowError, ValueError):
+            return sum(values)
+
+    def moving_average_weighted(self, weights: List[float]) -> List[float]:
+        """
+        Weighted moving average over each full window.
+
+        The window is as long as `weights`, and weights[0] applies to the
+        oldest value in it. Weights are used as given, so they should add up
+        to 1 for a true average. Plain moving_average() is faster for
+        equal weights.
+        """
+        weights = list(weights)
+        window = len(weights)
+        if window == 0:
+            raise ValueError("weights must not be empty")
+
         if len(self.data) < window:
             return self.data
 
-        result = []
-        for i in range(len(self.data) - window + 1):
-            window_data = self.data[i:i + window]
-            result.append(sum(window_data) / window)
+        return [
+            math.fsum(map(mul, weights, self.data[i:i + window]))
+            for i in range(len(self.data) - window + 1)
+        ]
 
-        return result
+    @staticmethod
+    def _mean_stdev(values: List[float]) -> Tuple[float, float, List[float]]:
+        """
+        Mean and sample standard deviation using exact float sums, plus the
+        deviation of each value from the mean
+        """
+        mean = statistics.fmean(values)
+        deviations = [value - mean for value in values]
+        # fmean can be off by an ulp; recentering on what the deviations
+        # still add up to puts a constant series at exactly zero spread
+        shift = math.fsum(deviations) / len(values)
+        if shift:
+            mean += shift
+            deviations = [value - mean for value in values]
+        variance = math.fsum(map(mul, deviations, deviations)) / (len(values) - 1)
+        return mean, math.sqrt(variance), deviations
 
     def detect_anomalies(self, threshold: float = 2.0) -> List[int]:
+        """
+        Indices of values more than `threshold` standard deviations from the mean.
+        """
         if len(self.data) < 2:
             return []
 
-        mean = statistics.mean(self.data)
-        stdev = statistics.stdev(self.data)
-
-        anomalies = []
-        for i, val in enumerate(self.data):
-            if stdev > 0:
-                z_score = abs((val - mean) / stdev)
-                if z_score > threshold:
-                    anomalies.append(i)
+        mean, stdev, deviations = self._mean_stdev(self.data)
+        if not stdev > 0:
+            return []
 
-        return anomalies
+        # |val - mean| / stdev > threshold, without a division per value
+        limit = threshold * stdev
+        return [i for i, deviation in enumerate(deviations) if abs(deviation) > limit]
 
     def calculate_trend(self) -> str:
         if len(self.data) < 2:
             return "insufficient_data"
 
         mid = len(self.data) // 2
-        avg_first = statistics.mean(self.data[:mid])
-        avg_second = statistics.mean(self.data[mid:])
+        avg_first = statistics.fmean(islice(self.data, mid))
+        avg_second = statistics.fmean(islice(self.data, mid, None))
 
         if avg_first > 0:
             diff_percent = ((avg_second - avg_first) / avg_first * 100)
@@ -195,63 +578,65 @@ class TimeSeriesAnalyzer:
 
 class ReportGenerator:
 
+    @staticmethod
+    def _header(title: str) -> str:
+        """Report banner; the timestamp is formatted once per report"""
+        generated = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        return f"{_BAR}\n{title}\n{_BAR}\nGenerated: {generated}"
+
     @staticmethod
     def generate_production_report(processor: ProductionDataProcessor) -> str:
-        lines = []
-        lines.append("=" * 60)
-        lines.append("PRODUCTION DATA ANALYSIS REPORT")
-        lines.append("=" * 60)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append("")
+        buf = io.StringIO()
+        w = buf.write
+        w(ReportGenerator._header("PRODUCTION DATA ANALYSIS REPORT"))
+        w("\n\n")
 
         avg = processor.calculate_daily_average()
-        lines.append(f"Average Daily Production: {avg:.2f} barrels\n")
+        w(f"Average Daily Production: {avg:.2f} barrels\n\n")
 
-        lines.append("Top 5 Production Days:")
-        lines.append("-" * 40)
+        w("Top 5 Production Days:\n")
+        w(_SUBBAR)
+        w("\n")
         for i, day in enumerate(processor.get_top_days(5), 1):
-            lines.append(f"{i}. {day['date']}: {day['production']:.2f} barrels")
+            w(f"{i}. {day['date']}: {day['production']:.2f} barrels\n")
 
-        lines.append("")
         errors = processor.validate_data()
-        lines.append(f"Data Quality: {len(errors)} errors found")
+        w(f"\nData Quality: {len(errors)} errors found\n")
 
         if errors:
             for err in errors[:5]:
-                lines.append(f"  - Row {err['row']}: {err['error']}")
+                w(f"  - Row {err['row']}: {err['error']}\n")
 
-        lines.append("=" * 60)
-        return "\n".join(lines)
+        w(_BAR)
+        return buf.getvalue()
 
     @staticmethod
     def generate_log_report(analyzer: LogFileAnalyzer) -> str:
-        lines = []
-        lines.append("=" * 60)
-        lines.append("SYSTEM LOG ANALYSIS REPORT")
-        lines.append("=" * 60)
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        buf = io.StringIO()
+        w = buf.write
+        w(ReportGenerator._header("SYSTEM LOG ANALYSIS REPORT"))
+        w("\n\n")
 
-        counts = analyzer.count_by_level()
+        counts, errors = analyzer.analyze()
         for level, count in counts.items():
-            lines.append(f"{level}: {count}")
+            w(f"{level}: {count}\n")
 
-        errors = analyzer.extract_errors()
-        lines.append(f"\nTotal Errors: {len(errors)}")
+        w(f"\nTotal Errors: {len(errors)}\n")
 
         for err in errors[-5:]:
-            lines.append(f"- {err[:80]}")
+            w(f"- {err[:80]}\n")
 
-        lines.append("=" * 60)
-        return "\n".join(lines)
+        w(_BAR)
+        return buf.getvalue()
 
     @staticmethod
     def export_to_json(processor: ProductionDataProcessor, filepath: str) -> None:
         report_data = {
-            'report_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'report_date': datetime.now().strftime(_TIMESTAMP_FORMAT),
             'average_production': processor.calculate_daily_average(),
             'top_days': processor.get_top_days(5),
             'validation_errors': processor.validate_data(),
-            'total_records': len(processor.data)
+            'total_records': len(processor.dates)
         }
 
         with open(filepath, 'w', encoding='utf-8') as f:
@@ -3,9 +3,12 @@ Test Suite for Energy Data Analysis Toolkit
 Testing all components to make sure everything works correctly
 """
 
+import csv
+import math
 import unittest
 import os
 import tempfile
+from unittest import mock
 from energy_toolkit import (
     ProductionDataProcessor,
     LogFileAnalyzer,
@@ -40,6 +43,28 @@ class TestProductionDataProcessor(unittest.TestCase):
     def test_data_loading(self):
         self.assertEqual(len(self.processor.data), 5)
 
+    def test_data_rows_match_dict_reader(self):
+        with open(self.test_file.name, newline='') as f:
+            expected = list(csv.DictReader(f))
+        self.assertEqual(self.processor.data, expected)
+        self.assertEqual(self.processor.data[4]['production'], 'invalid')
+
+    def test_columnar_storage(self):
+        self.assertEqual(len(self.processor.dates), 5)
+        self.assertEqual(len(self.processor.productions), 5)
+        self.assertEqual(self.processor.dates[0], '2024-01-01')
+        self.assertEqual(self.processor.productions[0], 1500.5)
+
+    def test_float32_storage(self):
+        compact = ProductionDataProcessor(self.test_file.name, typecode='f')
+        self.assertEqual(compact.productions.itemsize, 4)
+        self.assertAlmostEqual(
+            compact.calculate_daily_average(),
+            self.processor.calculate_daily_average(),
+            places=3
+        )
+        self.assertEqual(len(compact.validate_data()), len(self.processor.validate_data()))
+
     def test_validation_finds_errors(self):
         errors = self.processor.validate_data()
         self.assertGreater(len(errors), 0)
@@ -48,6 +73,22 @@ class TestProductionDataProcessor(unittest.TestCase):
         avg = self.processor.calculate_daily_average()
         self.assertGreater(avg, 0)
 
+    def test_average_with_infinite_values(self):
+        inf_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.csv'
+        )
+        inf_file.write("date,production\n")
+        inf_file.write("2024-01-01,inf\n")
+        inf_file.write("2024-01-02,-inf\n")
+        inf_file.write("2024-01-03,1e308\n")
+        inf_file.close()
+
+        try:
+            processor = ProductionDataProcessor(inf_file.name)
+            self.assertTrue(math.isnan(processor.calculate_daily_average()))
+        finally:
+            os.unlink(inf_file.name)
+
     def test_top_days(self):
         top = self.processor.get_top_days(3)
         self.assertLessEqual(len(top), 3)
@@ -58,6 +99,67 @@ class TestProductionDataProcessor(unittest.TestCase):
                 top[1]['production']
             )
 
+    def test_stream_top_days_matches_loaded(self):
+        expected = self.processor.get_top_days(3)
+        self.assertEqual(
+            ProductionDataProcessor.stream_top_days(self.test_file.name, 3),
+            expected
+        )
+
+        # Small chunks exercise merging across chunk boundaries
+        with mock.patch.object(ProductionDataProcessor, 'STREAM_CHUNK_ROWS', 2):
+            self.assertEqual(
+                ProductionDataProcessor.stream_top_days(self.test_file.name, 3),
+                expected
+            )
+
+    def test_empty_file(self):
+        empty_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.csv'
+        )
+        empty_file.close()
+
+        try:
+            processor = ProductionDataProcessor(empty_file.name)
+            self.assertEqual(processor.data, [])
+            self.assertEqual(processor.calculate_daily_average(), 0.0)
+            self.assertEqual(processor.get_top_days(), [])
+            self.assertEqual(ProductionDataProcessor.stream_top_days(empty_file.name), [])
+        finally:
+            os.unlink(empty_file.name)
+
+    def test_missing_columns_use_defaults(self):
+        odd_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.csv', encoding='utf-8'
+        )
+        # Excel's UTF-8 BOM hides the date column, as it always has
+        odd_file.write("\ufeffdate,production\n")
+        odd_file.write("2024-01-01,100\n")
+        odd_file.write("2024-01-02,150\n")
+        odd_file.close()
+
+        no_production = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.csv'
+        )
+        no_production.write("date,well_id\n")
+        no_production.write("2024-01-01,WELL-001\n")
+        no_production.close()
+
+        try:
+            processor = ProductionDataProcessor(odd_file.name)
+            self.assertEqual(processor.calculate_daily_average(), 125.0)
+            self.assertEqual(processor.get_top_days(1),
+                             [{'date': 'Unknown', 'production': 150.0}])
+            self.assertEqual(ProductionDataProcessor.stream_top_days(odd_file.name, 1),
+                             processor.get_top_days(1))
+
+            processor = ProductionDataProcessor(no_production.name)
+            self.assertEqual(processor.calculate_daily_average(), 0.0)
+            self.assertEqual(processor.validate_data(), [])
+        finally:
+            os.unlink(odd_file.name)
+            os.unlink(no_production.name)
+
 
 class TestLogFileAnalyzer(unittest.TestCase):
     """Tests for LogFileAnalyzer class"""
@@ -82,6 +184,9 @@ class TestLogFileAnalyzer(unittest.TestCase):
     def test_log_loading(self):
         self.assertEqual(len(self.analyzer.logs), 5)
 
+    def test_iter_logs_matches_loaded_logs(self):
+        self.assertEqual(list(self.analyzer.iter_logs()), self.analyzer.logs)
+
     def test_count_by_level(self):
         counts = self.analyzer.count_by_level()
         self.assertEqual(counts.get('ERROR', 0), 2)
@@ -92,10 +197,71 @@ class TestLogFileAnalyzer(unittest.TestCase):
         errors = self.analyzer.extract_errors()
         self.assertEqual(len(errors), 2)
 
+    def test_analyze_single_pass(self):
+        counts, errors = self.analyzer.analyze()
+        self.assertEqual(counts, self.analyzer.count_by_level())
+        self.assertEqual(errors, self.analyzer.extract_errors())
+
+    def test_crlf_log(self):
+        crlf_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.log', newline=''
+        )
+        crlf_file.write("2024-01-01 10:00:00 INFO System started\r\n")
+        crlf_file.write("2024-01-01 10:05:00 ERROR Pump x\r\n")
+        crlf_file.close()
+
+        try:
+            analyzer = LogFileAnalyzer(crlf_file.name)
+            self.assertEqual(analyzer.find_pattern('x$'),
+                             [(2, "2024-01-01 10:05:00 ERROR Pump x")])
+            self.assertEqual(analyzer.extract_errors(),
+                             ["2024-01-01 10:05:00 ERROR Pump x"])
+            parallel = LogFileAnalyzer(crlf_file.name, workers=2)
+            self.assertEqual(parallel.analyze(), analyzer.analyze())
+        finally:
+            os.unlink(crlf_file.name)
+
+    def test_pattern_ignores_non_ascii_case(self):
+        utf8_file = tempfile.NamedTemporaryFile(
+            mode='w', delete=False, suffix='.log', encoding='utf-8'
+        )
+        utf8_file.write("2024-01-01 10:00:00 INFO démarrage\n")
+        utf8_file.write("2024-01-01 10:05:00 érror é\n")
+        utf8_file.close()
+
+        try:
+            analyzer = LogFileAnalyzer(utf8_file.name)
+            self.assertEqual(analyzer.find_pattern('É'), [
+                (1, "2024-01-01 10:00:00 INFO démarrage"),
+                (2, "2024-01-01 10:05:00 érror é"),
+            ])
+        finally:
+            os.unlink(utf8_file.name)
+
+    def test_parallel_analyze_matches_serial(self):
+        parallel = LogFileAnalyzer(self.test_file.name, workers=3)
+        self.assertEqual(parallel.analyze(), self.analyzer.analyze())
+
+    def test_parallel_analyze_uses_loaded_lines(self):
+        parallel = LogFileAnalyzer(self.test_file.name, workers=2)
+        expected = self.analyzer.analyze()
+
+        with open(self.test_file.name, 'w') as f:
+            f.write("2024-01-02 09:00:00 INFO Rotated\n")
+
+        self.assertEqual(parallel.analyze(), expected)
+
     def test_pattern_search(self):
         matches = self.analyzer.find_pattern('sensor')
         self.assertGreater(len(matches), 0)
 
+    def test_pattern_line_numbers(self):
+        matches = self.analyzer.find_pattern(r'error \w+')
+        self.assertEqual(matches, [
+            (2, "2024-01-01 10:05:00 ERROR Database connection failed"),
+            (4, "2024-01-01 10:15:00 ERROR Sensor malfunction"),
+        ])
+
 
 class TestTimeSeriesAnalyzer(unittest.TestCase):
     """Tests for TimeSeriesAnalyzer class"""
@@ -111,12 +277,52 @@ class TestTimeSeriesAnalyzer(unittest.TestCase):
         self.assertGreater(len(ma), 0)
         self.assertLess(len(ma), len(self.normal_data))
 
+    def test_moving_average_after_large_value(self):
+        analyzer = TimeSeriesAnalyzer([1e17] + [1.0] * 20)
+        ma = analyzer.moving_average(window=3)
+
+        self.assertEqual(len(ma), 19)
+        self.assertEqual(ma[1:], [1.0] * 18)
+
+    def test_moving_average_large_window(self):
+        data = [float(i % 10) for i in range(60000)]
+        ma = TimeSeriesAnalyzer(data).moving_average(window=30000)
+
+        self.assertEqual(len(ma), 30001)
+        self.assertEqual(ma[0], 4.5)
+        self.assertAlmostEqual(ma[12345], sum(data[12345:42345]) / 30000)
+
+    def test_moving_average_non_finite(self):
+        inf = float('inf')
+        ma = TimeSeriesAnalyzer([1.0, inf, -inf, 2.0]).moving_average(window=2)
+        self.assertEqual(ma[0], inf)
+        self.assertTrue(math.isnan(ma[1]))
+        self.assertEqual(ma[2], -inf)
+
+        ma = TimeSeriesAnalyzer([1e308, 1e308, 1.0, 2.0]).moving_average(window=2)
+        self.assertEqual(ma, [inf, 5e307, 1.5])
+
+    def test_weighted_moving_average(self):
+        analyzer = TimeSeriesAnalyzer(self.normal_data)
+        weighted = analyzer.moving_average_weighted([0.25, 0.25, 0.5])
+
+        self.assertEqual(len(weighted), len(self.normal_data) - 2)
+        self.assertAlmostEqual(weighted[0], 102.75)
+
+        uniform = analyzer.moving_average_weighted([1 / 3] * 3)
+        for a, b in zip(uniform, analyzer.moving_average(window=3)):
+            self.assertAlmostEqual(a, b)
+
     def test_anomaly_detection(self):
         analyzer = TimeSeriesAnalyzer(self.anomaly_data)
         anomalies = analyzer.detect_anomalies(threshold=2.0)
 
         self.assertIn(3, anomalies)
 
+    def test_constant_series_has_no_anomalies(self):
+        analyzer = TimeSeriesAnalyzer([0.7, 0.7, 0.7])
+        self.assertEqual(analyzer.detect_anomalies(threshold=0.5), [])
+
     def test_trend_increasing(self):
         increasing_data = [100, 110, 120, 130, 140]
         analyzer = TimeSeriesAnalyzer(increasing_data)